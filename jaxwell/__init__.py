@@ -1 +1 @@
-from jaxwell.fdfd import solve, Params
+from jaxwell.fdfd import solve, solve_async, Params, SolveHandle
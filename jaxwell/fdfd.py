@@ -2,10 +2,14 @@
 
 from jaxwell import operators, cocg, vecfield
 
+import asyncio
+import concurrent.futures
 import dataclasses
 from functools import partial
+import jax
 from jax import custom_vjp
 import jax.numpy as np
+import threading
 from typing import Callable, Tuple
 
 
@@ -72,12 +76,17 @@ def _default_monitor_fn(x, errs):
   pass
 
 
+def _default_progress_fn(i, err, last):
+  return False
+
+
 def solve_impl(z,
                b,
                adjoint=False,
                params=Params(),
                monitor_fn=_default_monitor_fn,
                monitor_every_n=1000,
+               progress_fn=_default_progress_fn,
                ):
   '''Implementation of a FDFD solve.
 
@@ -87,6 +96,12 @@ def solve_impl(z,
     b: Same as `z` but for the `-iωJ` term.
     adjoint: Solve the adjoint problem instead, default `False`.
     params: `Params` options structure.
+    monitor_fn: Called as `monitor_fn(x, errs)` every `monitor_every_n`
+      iterations and once the solve has finished.
+    monitor_every_n: Number of iterations between calls to `monitor_fn`.
+    progress_fn: Called as `progress_fn(i, err, last)` after every iteration,
+      where `last` is `True` iff the solve stops after this iteration anyway,
+      returning `True` stops the solve early.
 
   Returns:
     `(x, errs)` where `x` is the `vecfield.VecField` of `jax.numpy.complex128`
@@ -116,9 +131,192 @@ def solve_impl(z,
     errs.append(err)
     if i % monitor_every_n == 0:
       monitor_fn(unpre(x), errs)
-    if err <= term_err:
+    last = bool(err <= term_err) or i == params.max_iters - 1
+    if progress_fn(i, err, last) or last:
       break
 
   monitor_fn(unpre(x), errs)
 
   return vecfield.to_tuple(unpre(x)), errs
+
+
+class SolveHandle:
+  '''Handle to a FDFD solve running in the background, see `solve_async`.
+
+  Wraps a `concurrent.futures.Future` and can be awaited from `asyncio` code.
+  '''
+
+  def __init__(self, future, state):
+    self._future = future
+    self._state = state
+
+  def done(self):
+    '''Returns `True` iff the solve has finished (or failed, or cancelled).'''
+    return self._future.done()
+
+  def running(self):
+    '''Returns `True` iff the solve is currently executing.'''
+    return self._future.running()
+
+  def cancel(self):
+    '''Cancels the solve, returns `True` iff it will not produce a result.
+
+    A running solve is stopped after its current iteration, after which
+    `result()` raises `concurrent.futures.CancelledError`. Returns `False` if
+    the iteration loop has already exited.
+    '''
+    if self._future.cancel():
+      return True
+    if self._future.done():
+      return self.cancelled()
+    return self._state.stop()
+
+  def cancelled(self):
+    '''Returns `True` iff the solve was cancelled.'''
+    if self._future.cancelled():
+      return True
+    return (self._future.done() and isinstance(
+        self._future.exception(), concurrent.futures.CancelledError))
+
+  def progress(self):
+    '''Returns `(num_iters, err)` for the latest completed iteration.
+
+    `err` is `None` until the first iteration has completed.
+    '''
+    return self._state.progress()
+
+  def result(self, timeout=None):
+    '''Blocks for at most `timeout` seconds and returns `(x, err)`.
+
+    Same return values as `solve`, raises `concurrent.futures.TimeoutError` if
+    the solve has not finished in time.
+    '''
+    return self._future.result(timeout)
+
+  def exception(self, timeout=None):
+    '''Returns the exception raised by the solve, or `None`.'''
+    return self._future.exception(timeout)
+
+  def add_done_callback(self, fn):
+    '''Calls `fn(handle)` once the solve has finished.'''
+    self._future.add_done_callback(lambda _: fn(self))
+
+  def __await__(self):
+    future = asyncio.wrap_future(self._future)
+
+    # `wrap_future` only cancels the wrapped future, which is a no-op once the
+    # solve is running, so also stop the iteration loop.
+    def cancel_solve(f):
+      if f.cancelled():
+        self.cancel()
+
+    future.add_done_callback(cancel_solve)
+    return future.__await__()
+
+
+class _SolveState:
+  '''Progress and stop request shared between a `SolveHandle` and its solve.'''
+
+  def __init__(self, progress_fn=None):
+    self._lock = threading.Lock()
+    self._progress_fn = progress_fn
+    self._stop = False
+    self._finished = False
+    self._cancelled = False
+    self._num_iters = 0
+    self._err = None
+
+  def __call__(self, i, err, last):
+    '''`progress_fn` for `solve_impl`.'''
+    with self._lock:
+      self._num_iters = i + 1
+      self._err = float(err)
+    if self._progress_fn is not None:
+      self._progress_fn(i, err)
+    with self._lock:
+      if self._stop:
+        self._cancelled = True
+      self._finished = self._cancelled or last
+      return self._cancelled
+
+  def stop(self):
+    '''Requests the solve to stop, returns `False` if it already has.'''
+    with self._lock:
+      if self._finished:
+        return self._cancelled
+      self._stop = True
+      return True
+
+  def cancelled(self):
+    with self._lock:
+      return self._cancelled
+
+  def progress(self):
+    with self._lock:
+      return self._num_iters, self._err
+
+
+def _submit_daemon(fn):
+  '''Runs `fn()` on a new daemon thread, so it does not block exiting.'''
+  future = concurrent.futures.Future()
+
+  def run():
+    if future.set_running_or_notify_cancel():
+      try:
+        future.set_result(fn())
+      except BaseException as e:
+        future.set_exception(e)
+
+  threading.Thread(target=run, name='jaxwell-solve', daemon=True).start()
+  return future
+
+
+def _check_not_traced(*args):
+  leaves = jax.tree_util.tree_leaves(args)
+  if any(isinstance(a, jax.core.Tracer) for a in leaves):
+    raise TypeError('`solve_async` cannot be used within JAX transformations '
+                    '(e.g. `jax.grad` or `jax.jit`), use `solve` instead.')
+
+
+def solve_async(params, z, b, executor=None, progress_fn=None):
+  '''Starts `solve(params, z, b)` in the background and returns immediately.
+
+  The host-side iteration loop runs on a worker thread. JAX releases the GIL
+  while running on the device, so other Python work (and other solves) can
+  proceed in the meantime. Note that the result is not differentiable, use
+  `solve` within `jax.grad` instead.
+
+    ```
+    handle = jaxwell.solve_async(params, z, b)
+    ...  # Do other work.
+    x, err = handle.result()  # Or `await handle` from a coroutine.
+    ```
+
+  Args:
+    params: `Params` options structure.
+    z: 3-tuple of `(xx, yy, zz)` arrays of type `jax.numpy.complex128`
+       corresponding to the x-, y-, and z-components of the `ω²ε` term.
+    b: Same as `z` but for the `-iωJ` term.
+    executor: `concurrent.futures.Executor` to run the solve on, defaults to
+      running each solve on its own daemon thread.
+    progress_fn: Optional function called as `progress_fn(i, err)` from the
+      worker thread after every iteration.
+
+  Returns:
+    `SolveHandle` for the running solve.
+
+  Raises:
+    TypeError: If `z` or `b` are being traced by a JAX transformation.
+  '''
+  _check_not_traced(z, b)
+  state = _SolveState(progress_fn)
+
+  def run():
+    x, errs = solve_impl(z, b, params=params, progress_fn=state)
+    if state.cancelled():
+      raise concurrent.futures.CancelledError()
+    return x, errs[-1]
+
+  if executor is None:
+    return SolveHandle(_submit_daemon(run), state)
+  return SolveHandle(executor.submit(run), state)
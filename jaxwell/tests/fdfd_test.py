@@ -1,6 +1,10 @@
 # TODO: Remove.
+import asyncio
+import concurrent.futures
+import dataclasses
 import jax
 import jax.numpy as np
+import threading
 import unittest
 import numpy as onp
 from jaxwell import fdfd, operators, vecfield
@@ -9,6 +13,27 @@ config.update("jax_enable_x64", True)
 #config.update("jax_debug_nans", True)
 
 
+class _DeferredExecutor(concurrent.futures.Executor):
+  '''Executor that only runs submitted calls on `run_pending()`.'''
+
+  def __init__(self):
+    self._pending = []
+
+  def submit(self, fn, *args, **kwargs):
+    future = concurrent.futures.Future()
+    self._pending.append((future, fn, args, kwargs))
+    return future
+
+  def run_pending(self):
+    for future, fn, args, kwargs in self._pending:
+      if future.set_running_or_notify_cancel():
+        try:
+          future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+          future.set_exception(e)
+    self._pending = []
+
+
 class TestJaxwell(unittest.TestCase):
   def setUp(self):
     self.b = onp.zeros((10, 10, 10), onp.complex128)
@@ -62,6 +87,163 @@ class TestJaxwell(unittest.TestCase):
     x, errs = fdfd.solve_impl(self.z, self.b, adjoint=True, params=self.params)
     self.assertAlmostEqual(errs[0], 0.01358992)
 
+  def test_solve_async(self):
+    handle = fdfd.solve_async(self.params, self.z, self.b)
+    x, err = handle.result()
+    self.assertTrue(handle.done())
+    self.assertEqual(x[0].shape, (10, 10, 10))
+    self.assertAlmostEqual(err, 35.25115523)
+    self.assertEqual(handle.progress()[0], 1)
+    self.assertAlmostEqual(handle.progress()[1], 35.25115523)
+
+  def test_solve_async_await(self):
+    async def run():
+      handles = [fdfd.solve_async(self.params, self.z, self.b)
+                 for _ in range(2)]
+      return await asyncio.gather(*handles)
+
+    for x, err in asyncio.run(run()):
+      self.assertAlmostEqual(err, 35.25115523)
+
+  def _never_converging_params(self):
+    return dataclasses.replace(self.params, eps=0., max_iters=1000000)
+
+  def test_solve_async_returns_immediately(self):
+    executor = _DeferredExecutor()
+    handle = fdfd.solve_async(self.params, self.z, self.b, executor)
+    self.assertFalse(handle.done())
+    self.assertEqual(handle.progress(), (0, None))
+
+    executor.run_pending()
+    self.assertTrue(handle.done())
+    self.assertAlmostEqual(handle.result()[1], 35.25115523)
+    self.assertFalse(handle.cancel())
+
+  def test_solve_async_progress(self):
+    params = dataclasses.replace(self.params, max_iters=3)
+    executor = _DeferredExecutor()
+    seen = []
+    handle = fdfd.solve_async(
+        params, self.z, self.b, executor,
+        progress_fn=lambda i, err: seen.append(
+            (handle.done(), handle.progress())))
+    executor.run_pending()
+
+    self.assertEqual([done for done, _ in seen], [False] * 3)
+    self.assertEqual([n for _, (n, _) in seen], [1, 2, 3])
+    self.assertAlmostEqual(seen[0][1][1], 35.25115523)
+    x, err = handle.result()
+    self.assertEqual(handle.progress(), (3, float(err)))
+
+  def test_solve_async_cancel_running(self):
+    executor = _DeferredExecutor()
+
+    def cancel_after_two_iters(i, err):
+      if i == 1:
+        self.assertTrue(handle.cancel())
+
+    handle = fdfd.solve_async(self._never_converging_params(), self.z, self.b,
+                              executor, progress_fn=cancel_after_two_iters)
+    executor.run_pending()
+
+    self.assertTrue(handle.done())
+    self.assertTrue(handle.cancelled())
+    self.assertEqual(handle.progress()[0], 2)
+    with self.assertRaises(concurrent.futures.CancelledError):
+      handle.result()
+    self.assertTrue(handle.cancel())
+
+  def test_solve_async_cancel_last_iter(self):
+    params = dataclasses.replace(self.params, max_iters=2)
+    executor = _DeferredExecutor()
+
+    def cancel_on_last_iter(i, err):
+      if i == 1:
+        self.assertTrue(handle.cancel())
+
+    handle = fdfd.solve_async(params, self.z, self.b, executor,
+                              progress_fn=cancel_on_last_iter)
+    executor.run_pending()
+    self.assertTrue(handle.cancelled())
+
+  def test_solve_async_cancel_pending(self):
+    executor = _DeferredExecutor()
+    handle = fdfd.solve_async(self.params, self.z, self.b, executor)
+    self.assertTrue(handle.cancel())
+    executor.run_pending()
+    self.assertTrue(handle.cancelled())
+    self.assertEqual(handle.progress(), (0, None))
+
+  def test_solve_async_error(self):
+    def fail(i, err):
+      raise RuntimeError('boom')
+
+    executor = _DeferredExecutor()
+    handle = fdfd.solve_async(self.params, self.z, self.b, executor,
+                              progress_fn=fail)
+    executor.run_pending()
+
+    self.assertTrue(handle.done())
+    self.assertFalse(handle.cancelled())
+    self.assertIsInstance(handle.exception(), RuntimeError)
+    with self.assertRaises(RuntimeError):
+      handle.result()
+
+  def test_solve_async_concurrent(self):
+    # Both solves must reach their second iteration before either may continue,
+    # so this only passes if the two solves are in flight at the same time.
+    barrier = threading.Barrier(3, timeout=60)
+
+    def wait_for_both(i, err):
+      if i == 1:
+        barrier.wait()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+      handles = [
+          fdfd.solve_async(self._never_converging_params(), self.z, self.b,
+                           executor, progress_fn=wait_for_both)
+          for _ in range(2)
+      ]
+      try:
+        barrier.wait()
+        for handle in handles:
+          self.assertTrue(handle.running())
+          self.assertFalse(handle.done())
+          self.assertGreater(handle.progress()[0], 0)
+      finally:
+        for handle in handles:
+          self.assertTrue(handle.cancel())
+      for handle in handles:
+        with self.assertRaises(concurrent.futures.CancelledError):
+          handle.result(timeout=60)
+
+  def test_solve_async_await_cancel(self):
+    started = threading.Event()
+
+    def notify_started(i, err):
+      started.set()
+
+    handle = fdfd.solve_async(self._never_converging_params(), self.z, self.b,
+                              progress_fn=notify_started)
+
+    async def run():
+      await asyncio.get_running_loop().run_in_executor(None, started.wait, 60)
+      with self.assertRaises(asyncio.TimeoutError):
+        await asyncio.wait_for(handle, timeout=0.1)
+
+    asyncio.run(run())
+    with self.assertRaises(concurrent.futures.CancelledError):
+      handle.result(timeout=60)
+    self.assertTrue(handle.cancelled())
+
+  def test_solve_async_traced(self):
+    def foo(z):
+      fdfd.solve_async(self.params, (z,) * 3, self.b)
+      return z
+
+    with self.assertRaises(TypeError):
+      jax.grad(lambda z: np.sum(foo(z)))(self.z[0])
+
 
 if __name__ == '__main__':
   unittest.main()